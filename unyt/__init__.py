@@ -68,9 +68,14 @@ from ._version import __version__
 # constants used to *construct* a physical constant) in this namespace
 def import_units(module, namespace):
     """Import Unit objects from a module into a namespace"""
-    for key, value in module.__dict__.items():
-        if isinstance(value, (unyt_quantity, Unit)):
-            namespace[key] = value
+    # exact type checks are enough here (no subclasses are defined in
+    # these modules) and a single update avoids per-key assignments
+    unit_types = (unyt_quantity, Unit)
+    namespace.update(
+        (key, value)
+        for key, value in module.__dict__.items()
+        if type(value) in unit_types
+    )
 
 
 import_units(unit_symbols, globals())
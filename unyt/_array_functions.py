@@ -1,9 +1,9 @@
+import re
 import warnings
-from importlib.metadata import version
+from functools import lru_cache
 from numbers import Number
 
 import numpy as np
-from packaging.version import Version
 
 from unyt import delta_degC
 from unyt.array import NULL_UNIT, unyt_array, unyt_quantity
@@ -13,8 +13,13 @@ from unyt.exceptions import (
     UnitInconsistencyError,
     UnytError,
 )
+from unyt.unit_object import _check_em_conversion
 
-NUMPY_VERSION = Version(version("numpy"))
+# (major, minor) is all we need to gate on, so we avoid the cost of
+# importing a full version parser at import time
+NUMPY_VERSION = tuple(
+    int(_) for _ in re.match(r"(\d+)\.(\d+)", np.__version__).groups()
+)
 
 # Functions for which passing units doesn't make sense
 # bail out with NotImplemented (escalated to TypeError by numpy)
@@ -45,6 +50,21 @@ _UNSUPPORTED_FUNCTIONS = {
 
 _HANDLED_FUNCTIONS = {}
 
+# numpy implementations used on hot paths, bound once at import time
+# so that each call doesn't have to look them up again
+_dot_impl = np.dot._implementation
+_vdot_impl = np.vdot._implementation
+_inner_impl = np.inner._implementation
+_outer_impl = np.outer._implementation
+_kron_impl = np.kron._implementation
+_cross_impl = np.cross._implementation
+_concatenate_impl = np.concatenate._implementation
+_stack_impl = np.stack._implementation
+_vstack_impl = np.vstack._implementation
+_hstack_impl = np.hstack._implementation
+_dstack_impl = np.dstack._implementation
+_column_stack_impl = np.column_stack._implementation
+
 
 def implements(numpy_function):
     """Register an __array_function__ implementation for unyt_array objects."""
@@ -57,6 +77,87 @@ def implements(numpy_function):
     return decorator
 
 
+# unit arithmetic goes through sympy, so results are memoized
+# for the wrappers that combine units on every call
+@lru_cache(maxsize=128, typed=False)
+def _mul_units(u1, u2):
+    return u1 * u2
+
+
+@lru_cache(maxsize=128, typed=False)
+def _pow_units(u, p):
+    return u**p
+
+
+def _inv_units(u):
+    # NULL_UNIT is its own inverse
+    if u is NULL_UNIT:
+        return u
+    return _pow_units(u, -1)
+
+
+def _units_of(x):
+    # unyt_quantity derives from unyt_array, anything else is unitless
+    return x.units if isinstance(x, unyt_array) else NULL_UNIT
+
+
+def _product_units(au, bu):
+    # multiplying by NULL_UNIT is a no-op: skip the unit arithmetic entirely
+    if bu is NULL_UNIT:
+        return au
+    if au is NULL_UNIT:
+        return bu
+    return _mul_units(au, bu)
+
+
+def _quotient_units(nu, de):
+    # identical units cancel out, except for units with an offset (degC, degF)
+    # whose product must raise InvalidUnitOperation.
+    # Otherwise multiply by the inverse, as the array arithmetic this
+    # replaces did: Unit division rejects offset units altogether
+    if nu is de and not nu.base_offset:
+        return NULL_UNIT
+    return _product_units(nu, _inv_units(de))
+
+
+def _asnd(x):
+    # numpy accepts scalars and sequences as operands too, only arrays
+    # need (and support) stripping down to a plain ndarray view,
+    # and plain ndarrays can be used as they are
+    if type(x) is np.ndarray or not isinstance(x, np.ndarray):
+        return x
+    return x.view(np.ndarray)
+
+
+def _as_operand(x):
+    # return a (numpy operand, units) pair for a product's operand.
+    # Scalars and sequences of pure numbers are passed through as they are,
+    # sequences holding quantities are converted (and their units validated)
+    if isinstance(x, np.ndarray):
+        return _asnd(x), _units_of(x)
+    if isinstance(x, (list, tuple)) and any(
+        u is not NULL_UNIT for u in _iter_units((x,))
+    ):
+        x = unyt_array(x)
+        return x.view(np.ndarray), x.units
+    return x, NULL_UNIT
+
+
+def _set_units(out, units):
+    # propagate units to a user-provided output array, if it can hold them
+    if isinstance(out, unyt_array):
+        out.units = units
+
+
+def _fast_wrap(res, units):
+    # attach units to a raw numpy result by viewing it as a unyt type,
+    # skipping the unyt_array constructor
+    res = np.asarray(res)
+    ret = res.view(unyt_quantity if res.ndim == 0 else unyt_array)
+    ret.units = units
+    return ret
+
+
 @implements(np.array2string)
 def array2string(a, *args, **kwargs):
     return (
@@ -65,62 +166,70 @@ def array2string(a, *args, **kwargs):
     )
 
 
-def product_helper(a, b, out, func):
-    prod_units = getattr(a, "units", NULL_UNIT) * getattr(b, "units", NULL_UNIT)
+def product_helper(a, b, out, impl):
+    a, au = _as_operand(a)
+    b, bu = _as_operand(b)
+    prod_units = _product_units(au, bu)
     if out is None:
-        return func._implementation(a.view(np.ndarray), b.view(np.ndarray)) * prod_units
-    res = func._implementation(
-        a.view(np.ndarray), b.view(np.ndarray), out=out.view(np.ndarray)
-    )
-    if getattr(out, "units", None) is not None:
-        out.units = prod_units
-    return unyt_array(res, prod_units, bypass_validation=True)
+        return impl(a, b) * prod_units
+    res = impl(a, b, out=_asnd(out))
+    _set_units(out, prod_units)
+    return _fast_wrap(res, prod_units)
 
 
 @implements(np.dot)
 def dot(a, b, out=None):
-    return product_helper(a, b, out, np.dot)
+    return product_helper(a, b, out, _dot_impl)
 
 
 @implements(np.vdot)
 def vdot(a, b):
-    return np.vdot._implementation(a.view(np.ndarray), b.view(np.ndarray)) * (
-        getattr(a, "units", NULL_UNIT) * getattr(b, "units", NULL_UNIT)
-    )
+    a, au = _as_operand(a)
+    b, bu = _as_operand(b)
+    return _vdot_impl(a, b) * _product_units(au, bu)
 
 
 @implements(np.inner)
 def inner(a, b):
-    return np.inner._implementation(a.view(np.ndarray), b.view(np.ndarray)) * (
-        getattr(a, "units", NULL_UNIT) * getattr(b, "units", NULL_UNIT)
-    )
+    a, au = _as_operand(a)
+    b, bu = _as_operand(b)
+    return _inner_impl(a, b) * _product_units(au, bu)
 
 
 @implements(np.outer)
 def outer(a, b, out=None):
-    return product_helper(a, b, out, np.outer)
+    return product_helper(a, b, out, _outer_impl)
 
 
 @implements(np.kron)
 def kron(a, b):
-    return np.kron._implementation(a.view(np.ndarray), b.view(np.ndarray)) * (
-        getattr(a, "units", NULL_UNIT) * getattr(b, "units", NULL_UNIT)
-    )
+    a, au = _as_operand(a)
+    b, bu = _as_operand(b)
+    return _kron_impl(a, b) * _product_units(au, bu)
 
 
 @implements(np.linalg.inv)
 def linalg_inv(a, *args, **kwargs):
-    return np.linalg.inv._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
+    ret_units = _inv_units(a.units)
+    return _fast_wrap(
+        np.linalg.inv._implementation(_asnd(a), *args, **kwargs), ret_units
+    )
 
 
 @implements(np.linalg.tensorinv)
 def linalg_tensorinv(a, *args, **kwargs):
-    return np.linalg.tensorinv._implementation(a, *args, **kwargs) / a.units
+    ret_units = _inv_units(a.units)
+    return _fast_wrap(
+        np.linalg.tensorinv._implementation(_asnd(a), *args, **kwargs), ret_units
+    )
 
 
 @implements(np.linalg.pinv)
 def linalg_pinv(a, *args, **kwargs):
-    return np.linalg.pinv._implementation(a, *args, **kwargs).view(np.ndarray) / a.units
+    ret_units = _inv_units(a.units)
+    return _fast_wrap(
+        np.linalg.pinv._implementation(_asnd(a), *args, **kwargs), ret_units
+    )
 
 
 @implements(np.linalg.svd)
@@ -136,21 +245,70 @@ def linalg_svd(a, full_matrices=True, compute_uv=True, *args, **kwargs):
         return retv * ret_units
 
 
-def _sanitize_range(_range, units):
+@lru_cache(maxsize=128, typed=False)
+def _range_conversion(from_units, to_units):
+    # E&M conversions can't be expressed as a factor and an offset,
+    # signal the caller to fall back to unyt_array.to
+    if any(_check_em_conversion(from_units, to_units, registry=from_units.registry)):
+        return None
+    return from_units.get_conversion_factor(to_units)
+
+
+def _sanitize_range(_range, units, *, flat=False):
     # helper function to histogram* functions
-    ndim = len(units)
+    # bounds are given flat, as (min0, max0, min1, max1, ...)
+    # np.histogram wants them as such, the others as (ndim, 2)
     if _range is None:
         return _range
-    new_range = np.empty((ndim, 2))
-    for i in range(ndim):
-        ilim = _range[2 * i : 2 * (i + 1)]
-        imin, imax = ilim
-        if not (hasattr(imin, "units") and hasattr(imax, "units")):
-            raise TypeError(
-                f"Elements of range must both have a 'units' attribute. Got {_range}"
-            )
-        new_range[i] = imin.to(units[i]).value, imax.to(units[i]).value
-    return new_range.squeeze()
+    ndim = len(units)
+    if len(_range) != 2 * ndim:
+        raise ValueError(
+            f"Expected {2 * ndim} range bounds (a min and a max per dimension), "
+            f"got {len(_range)}"
+        )
+    if not all(hasattr(bound, "units") for bound in _range):
+        raise TypeError(
+            f"Elements of range must both have a 'units' attribute. Got {_range}"
+        )
+    # gather raw values and conversion coefficients,
+    # then convert all bounds at once
+    new_range = np.empty(2 * ndim)
+    factors = np.ones(2 * ndim)
+    offsets = np.zeros(2 * ndim)
+    for i, bound in enumerate(_range):
+        u = units[i // 2]
+        if bound.units is u:
+            # typical when the range is built from the data itself
+            new_range[i] = bound.d
+            continue
+        conv = _range_conversion(bound.units, u)
+        if conv is None:
+            new_range[i] = bound.to(u).value
+            continue
+        new_range[i] = bound.d
+        factors[i] = conv[0]
+        offsets[i] = conv[1] or 0.0
+    new_range *= factors
+    new_range -= offsets
+    if flat:
+        return new_range
+    return new_range.reshape(ndim, 2)
+
+
+def _wrap_edges(edges, bins, units):
+    # numpy hands back bin edges given as arrays as they are,
+    # copy them so that the result doesn't alias the caller's bins
+    if isinstance(bins, np.ndarray):
+        aliased = np.may_share_memory(edges, bins)
+    elif isinstance(bins, (list, tuple)):
+        aliased = any(
+            isinstance(b, np.ndarray) and np.may_share_memory(edges, b) for b in bins
+        )
+    else:
+        aliased = False
+    if aliased:
+        edges = edges.copy()
+    return _fast_wrap(edges, units)
 
 
 @implements(np.histogram)
@@ -161,11 +319,11 @@ def histogram(
     *args,
     **kwargs,
 ):
-    range = _sanitize_range(range, units=[a.units])
-    counts, bins = np.histogram._implementation(
+    range = _sanitize_range(range, units=[a.units], flat=True)
+    counts, edges = np.histogram._implementation(
         a.view(np.ndarray), bins, range, *args, **kwargs
     )
-    return counts, bins * a.units
+    return counts, _wrap_edges(edges, bins, a.units)
 
 
 @implements(np.histogram2d)
@@ -174,37 +332,54 @@ def histogram2d(x, y, bins=10, range=None, *args, **kwargs):
     counts, xbins, ybins = np.histogram2d._implementation(
         x.view(np.ndarray), y.view(np.ndarray), bins, range, *args, **kwargs
     )
-    return counts, xbins * x.units, ybins * y.units
+    return (
+        counts,
+        _wrap_edges(xbins, bins, x.units),
+        _wrap_edges(ybins, bins, y.units),
+    )
 
 
 @implements(np.histogramdd)
 def histogramdd(sample, bins=10, range=None, *args, **kwargs):
-    units = [_.units for _ in sample]
+    views = []
+    units = []
+    for x in sample:
+        view, u = _as_operand(x)
+        views.append(view)
+        units.append(u)
     range = _sanitize_range(range, units=units)
-    counts, bins = np.histogramdd._implementation(
-        [_.view(np.ndarray) for _ in sample], bins, range, *args, **kwargs
-    )
-    return counts, tuple(_bin * u for _bin, u in zip(bins, units))
+    counts, edges = np.histogramdd._implementation(views, bins, range, *args, **kwargs)
+    return counts, tuple(_wrap_edges(e, bins, u) for e, u in zip(edges, units))
 
 
 @implements(np.histogram_bin_edges)
-def histogram_bin_edges(a, *args, **kwargs):
-    return (
-        np.histogram_bin_edges._implementation(a.view(np.ndarray), *args, **kwargs)
-        * a.units
+def histogram_bin_edges(a, bins=10, range=None, *args, **kwargs):
+    range = _sanitize_range(range, units=[a.units], flat=True)
+    edges = np.histogram_bin_edges._implementation(
+        a.view(np.ndarray), bins, range, *args, **kwargs
     )
+    return _wrap_edges(edges, bins, a.units)
+
+
+def _iter_units(objs):
+    # iterative depth-first traversal of (possibly nested) sequences,
+    # yielding units in the same order a recursive walk would
+    stack = [iter(objs)]
+    while stack:
+        for sub in stack[-1]:
+            if type(sub) is unyt_array or isinstance(sub, np.ndarray):
+                yield _units_of(sub)
+            elif isinstance(sub, (Number, str)):
+                yield NULL_UNIT
+            else:
+                stack.append(iter(sub))
+                break
+        else:
+            stack.pop()
 
 
 def get_units(objs):
-    units = []
-    for sub in objs:
-        if isinstance(sub, np.ndarray):
-            units.append(getattr(sub, "units", NULL_UNIT))
-        elif isinstance(sub, Number):
-            units.append(NULL_UNIT)
-        else:
-            units.extend(get_units(sub))
-    return units
+    return list(_iter_units(objs))
 
 
 def _validate_units_consistency(objs):
@@ -215,12 +390,19 @@ def _validate_units_consistency(objs):
     # by using this as a guard clause in unyt_array.__array_function__
     # because it's already a necessary condition for numpy to use our
     # custom implementations
-    units = get_units(objs)
-    sunits = set(units)
-    if len(sunits) == 1:
-        return units[0]
-    else:
-        raise UnitInconsistencyError(*units)
+    if isinstance(objs, (tuple, list)) and objs:
+        first = objs[0]
+        if isinstance(first, np.ndarray) and all(obj is first for obj in objs):
+            # a single array, possibly repeated: nothing to compare
+            return _units_of(first)
+    units = _iter_units(objs)
+    ret_units = next(units, None)
+    if ret_units is None:
+        raise UnitInconsistencyError()
+    for u in units:
+        if u is not ret_units and u != ret_units:
+            raise UnitInconsistencyError(ret_units, u)
+    return ret_units
 
 
 def _validate_units_consistency_v2(ref_units, *args) -> None:
@@ -231,223 +413,183 @@ def _validate_units_consistency_v2(ref_units, *args) -> None:
     """
     if all(isinstance(_, Number) for _ in args):
         return
-    else:
-        _validate_units_consistency((1 * ref_units, *args))
-
-
-@implements(np.concatenate)
-def concatenate(arrs, /, axis=0, out=None, *args, **kwargs):
-    ret_units = _validate_units_consistency(arrs)
+    for u in _iter_units(args):
+        if u is not ref_units and u != ref_units:
+            raise UnitInconsistencyError(ref_units, u)
 
-    if out is not None:
-        out_view = out.view(np.ndarray)
-    else:
-        out_view = out
 
-    res = np.concatenate._implementation(
-        [_.view(np.ndarray) for _ in arrs], axis, out_view, *args, **kwargs
-    )
+def _views_and_units(arrs):
+    """
+    Return ndarray views of a flat sequence of arrays and their unique units,
+    or raise UnitInconsistencyError if units are mixed.
+    This fuses unit validation and view collection into a single pass.
+    """
+    views = []
+    ret_units = None
+    for arr in arrs:
+        if isinstance(arr, np.ndarray):
+            units = (_units_of(arr),)
+        else:
+            # sequences are passed through as is, but may hold quantities
+            units = _iter_units((arr,))
+        for u in units:
+            if ret_units is None:
+                ret_units = u
+            elif u is not ret_units and u != ret_units:
+                raise UnitInconsistencyError(ret_units, u)
+        views.append(_asnd(arr))
+    if ret_units is None:
+        raise UnitInconsistencyError()
+    return views, ret_units
 
-    if getattr(out, "units", None) is not None:
-        out.units = ret_units
 
-    return unyt_array(res, ret_units, bypass_validation=True)
+@implements(np.concatenate)
+def concatenate(arrs, /, axis=0, out=None, *args, **kwargs):
+    views, ret_units = _views_and_units(arrs)
+    res = _concatenate_impl(views, axis, _asnd(out), *args, **kwargs)
+    _set_units(out, ret_units)
+    return _fast_wrap(res, ret_units)
 
 
 @implements(np.cross)
 def cross(a, b, *args, **kwargs):
-    prod_units = getattr(a, "units", NULL_UNIT) * getattr(b, "units", NULL_UNIT)
-    return (
-        np.cross._implementation(
-            a.view(np.ndarray), b.view(np.ndarray), *args, **kwargs
-        )
-        * prod_units
-    )
+    a, au = _as_operand(a)
+    b, bu = _as_operand(b)
+    return _cross_impl(a, b, *args, **kwargs) * _product_units(au, bu)
 
 
 @implements(np.intersect1d)
 def intersect1d(arr1, arr2, /, assume_unique=False, return_indices=False):
-    _validate_units_consistency((arr1, arr2))
+    ret_units = _validate_units_consistency((arr1, arr2))
     retv = np.intersect1d._implementation(
-        arr1.view(np.ndarray),
-        arr2.view(np.ndarray),
+        _asnd(arr1),
+        _asnd(arr2),
         assume_unique=assume_unique,
         return_indices=return_indices,
     )
     if return_indices:
-        return retv
+        values, ind1, ind2 = retv
+        return _fast_wrap(values, ret_units), ind1, ind2
     else:
-        return retv * arr1.units
+        return _fast_wrap(retv, ret_units)
 
 
 @implements(np.union1d)
 def union1d(arr1, arr2, /):
-    _validate_units_consistency((arr1, arr2))
-    return (
-        np.union1d._implementation(arr1.view(np.ndarray), arr2.view(np.ndarray))
-        * arr1.units
-    )
+    ret_units = _validate_units_consistency((arr1, arr2))
+    return _fast_wrap(np.union1d._implementation(_asnd(arr1), _asnd(arr2)), ret_units)
 
 
 @implements(np.linalg.norm)
 def norm(x, /, *args, **kwargs):
-    return np.linalg.norm._implementation(x.view(np.ndarray), *args, **kwargs) * x.units
+    return _fast_wrap(
+        np.linalg.norm._implementation(_asnd(x), *args, **kwargs), x.units
+    )
 
 
 @implements(np.vstack)
 def vstack(tup, /):
-    ret_units = _validate_units_consistency(tup)
-    return np.vstack._implementation([_.view(np.ndarray) for _ in tup]) * ret_units
+    views, ret_units = _views_and_units(tup)
+    return _fast_wrap(_vstack_impl(views), ret_units)
 
 
 @implements(np.hstack)
 def hstack(tup, /):
-    ret_units = _validate_units_consistency(tup)
-    return np.vstack._implementation([_.view(np.ndarray) for _ in tup]) * ret_units
+    views, ret_units = _views_and_units(tup)
+    if all(isinstance(v, np.ndarray) and v.ndim == 1 for v in views):
+        # this is what np.hstack boils down to for 1D inputs
+        return _fast_wrap(_concatenate_impl(views, 0), ret_units)
+    return _fast_wrap(_hstack_impl(views), ret_units)
 
 
 @implements(np.dstack)
 def dstack(tup, /):
-    ret_units = _validate_units_consistency(tup)
-    return np.dstack._implementation([_.view(np.ndarray) for _ in tup]) * ret_units
+    views, ret_units = _views_and_units(tup)
+    return _fast_wrap(_dstack_impl(views), ret_units)
 
 
 @implements(np.column_stack)
 def column_stack(tup, /):
-    ret_units = _validate_units_consistency(tup)
-    return (
-        np.column_stack._implementation([_.view(np.ndarray) for _ in tup]) * ret_units
-    )
+    views, ret_units = _views_and_units(tup)
+    return _fast_wrap(_column_stack_impl(views), ret_units)
 
 
 @implements(np.stack)
 def stack(arrays, /, axis=0, out=None):
-    ret_units = _validate_units_consistency(arrays)
-    if out is None:
-        return (
-            np.stack._implementation([_.view(np.ndarray) for _ in arrays], axis=axis)
-            * ret_units
-        )
-    res = np.stack._implementation(
-        [_.view(np.ndarray) for _ in arrays], axis=axis, out=out.view(np.ndarray)
-    )
-    if getattr(out, "units", None) is not None:
-        out.units = ret_units
-    return unyt_array(res, ret_units, bypass_validation=True)
+    views, ret_units = _views_and_units(arrays)
+    res = _stack_impl(views, axis=axis, out=_asnd(out))
+    _set_units(out, ret_units)
+    return _fast_wrap(res, ret_units)
 
 
 @implements(np.around)
 def around(a, decimals=0, out=None):
     ret_units = a.units
-    if out is None:
-        return (
-            np.around._implementation(a.view(np.ndarray), decimals=decimals) * ret_units
-        )
-    res = np.around._implementation(
-        a.view(np.ndarray), decimals=decimals, out=out.view(np.ndarray)
-    )
-    if getattr(out, "units", None) is not None:
-        out.units = ret_units
-    return unyt_array(res, ret_units, bypass_validation=True)
+    res = np.around._implementation(_asnd(a), decimals=decimals, out=_asnd(out))
+    _set_units(out, ret_units)
+    return _fast_wrap(res, ret_units)
 
 
 @implements(np.block)
 def block(arrays):
     ret_units = _validate_units_consistency(arrays)
-    return np.block._implementation(arrays) * ret_units
-
-
-@implements(np.fft.fft)
-def ftt_fft(a, *args, **kwargs):
-    return np.fft.fft._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
-
-
-@implements(np.fft.fft2)
-def ftt_fft2(a, *args, **kwargs):
-    return np.fft.fft2._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
-
-
-@implements(np.fft.fftn)
-def ftt_fftn(a, *args, **kwargs):
-    return np.fft.fftn._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
-
-
-@implements(np.fft.hfft)
-def ftt_hfft(a, *args, **kwargs):
-    return np.fft.hfft._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
-
-
-@implements(np.fft.rfft)
-def ftt_rfft(a, *args, **kwargs):
-    return np.fft.rfft._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
-
-
-@implements(np.fft.rfft2)
-def ftt_rfft2(a, *args, **kwargs):
-    return np.fft.rfft2._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
-
-
-@implements(np.fft.rfftn)
-def ftt_rfftn(a, *args, **kwargs):
-    return np.fft.rfftn._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
-
-
-@implements(np.fft.ifft)
-def ftt_ifft(a, *args, **kwargs):
-    return np.fft.ifft._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
-
-
-@implements(np.fft.ifft2)
-def ftt_ifft2(a, *args, **kwargs):
-    return np.fft.ifft2._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
-
-
-@implements(np.fft.ifftn)
-def ftt_ifftn(a, *args, **kwargs):
-    return np.fft.ifftn._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
-
-
-@implements(np.fft.ihfft)
-def ftt_ihfft(a, *args, **kwargs):
-    return np.fft.ihfft._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
-
-
-@implements(np.fft.irfft)
-def ftt_irfft(a, *args, **kwargs):
-    return np.fft.irfft._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
-
-
-@implements(np.fft.irfft2)
-def ftt_irfft2(a, *args, **kwargs):
-    return np.fft.irfft2._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
-
-
-@implements(np.fft.irfftn)
-def ftt_irfftn(a, *args, **kwargs):
-    return np.fft.irfftn._implementation(a.view(np.ndarray), *args, **kwargs) / a.units
-
-
-@implements(np.fft.fftshift)
-def fft_fftshift(x, *args, **kwargs):
-    return (
-        np.fft.fftshift._implementation(x.view(np.ndarray), *args, **kwargs) * x.units
-    )
-
-
-@implements(np.fft.ifftshift)
-def fft_ifftshift(x, *args, **kwargs):
-    return (
-        np.fft.ifftshift._implementation(x.view(np.ndarray), *args, **kwargs) * x.units
-    )
+    return _fast_wrap(np.block._implementation(arrays), ret_units)
+
+
+def _same_units(u):
+    return u
+
+
+def _make_fft_wrapper(fft_func, units_func=_inv_units):
+    # all forward and inverse transforms share the same unit logic:
+    # the result is expressed in the reciprocal of the input units.
+    # Shifts only reorder elements and keep the input units.
+    impl = fft_func._implementation
+
+    def wrapper(a, *args, **kwargs):
+        ret_units = units_func(a.units)
+        return _fast_wrap(impl(_asnd(a), *args, **kwargs), ret_units)
+
+    wrapper.__name__ = wrapper.__qualname__ = f"fft_{fft_func.__name__}"
+    return wrapper
+
+
+_HANDLED_FUNCTIONS.update(
+    {
+        fft_func: _make_fft_wrapper(fft_func)
+        for fft_func in (
+            np.fft.fft,
+            np.fft.fft2,
+            np.fft.fftn,
+            np.fft.hfft,
+            np.fft.rfft,
+            np.fft.rfft2,
+            np.fft.rfftn,
+            np.fft.ifft,
+            np.fft.ifft2,
+            np.fft.ifftn,
+            np.fft.ihfft,
+            np.fft.irfft,
+            np.fft.irfft2,
+            np.fft.irfftn,
+        )
+    }
+)
+_HANDLED_FUNCTIONS.update(
+    {
+        fft_func: _make_fft_wrapper(fft_func, _same_units)
+        for fft_func in (np.fft.fftshift, np.fft.ifftshift)
+    }
+)
 
 
 @implements(np.trapz)
 def trapz(y, x=None, dx=1.0, *args, **kwargs):
     ret_units = y.units
     if x is None:
-        ret_units = ret_units * getattr(dx, "units", NULL_UNIT)
+        ret_units = ret_units * _units_of(dx)
     else:
-        ret_units = ret_units * getattr(x, "units", NULL_UNIT)
+        ret_units = ret_units * _units_of(x)
     if isinstance(x, np.ndarray):
         x = x.view(np.ndarray)
     if isinstance(dx, np.ndarray):
@@ -463,38 +605,32 @@ def sort_complex(a):
 
 
 def _array_comp_helper(a, b):
-    au = getattr(a, "units", NULL_UNIT)
-    bu = getattr(b, "units", NULL_UNIT)
+    # return raw ndarrays to be compared, with b expressed in a's units.
+    # A unitless operand is taken to be in the other operand's units,
+    # so it can be compared as is, without building a unyt_array from it
+    au = _units_of(a)
+    bu = _units_of(b)
     if bu != au and au != NULL_UNIT and bu != NULL_UNIT:
         b = b.in_units(au)
-    elif bu == NULL_UNIT:
-        b = np.array(b) * au
-    elif au == NULL_UNIT:
-        a = np.array(a) * bu
-
-    return a, b
+    return np.asarray(a), np.asarray(b)
 
 
 @implements(np.isclose)
 def isclose(a, b, *args, **kwargs):
     a, b = _array_comp_helper(a, b)
-    return np.isclose._implementation(
-        a.view(np.ndarray), b.view(np.ndarray), *args, **kwargs
-    )
+    return np.isclose._implementation(a, b, *args, **kwargs)
 
 
 @implements(np.allclose)
 def allclose(a, b, *args, **kwargs):
     a, b = _array_comp_helper(a, b)
-    return np.allclose._implementation(
-        a.view(np.ndarray), b.view(np.ndarray), *args, **kwargs
-    )
+    return np.allclose._implementation(a, b, *args, **kwargs)
 
 
 @implements(np.array_equal)
 def array_equal(a1, a2, *args, **kwargs) -> bool:
-    u1 = getattr(a1, "units", NULL_UNIT)
-    u2 = getattr(a2, "units", NULL_UNIT)
+    u1 = _units_of(a1)
+    u2 = _units_of(a2)
     if u2 != u1:
         return False
 
@@ -505,8 +641,8 @@ def array_equal(a1, a2, *args, **kwargs) -> bool:
 
 @implements(np.array_equiv)
 def array_equiv(a1, a2, *args, **kwargs) -> bool:
-    u1 = getattr(a1, "units", NULL_UNIT)
-    u2 = getattr(a2, "units", NULL_UNIT)
+    u1 = _units_of(a1)
+    u2 = _units_of(a2)
     if u2 != u1:
         return False
 
@@ -560,14 +696,16 @@ def copyto(dst, src, *args, **kwargs):
 
 @implements(np.prod)
 def prod(a, *args, **kwargs):
-    return (
-        np.prod._implementation(a.view(np.ndarray), *args, **kwargs) * a.units**a.size
-    )
+    au = a.units
+    ret_units = au if au is NULL_UNIT else _pow_units(au, a.size)
+    return np.prod._implementation(a.view(np.ndarray), *args, **kwargs) * ret_units
 
 
 @implements(np.var)
 def var(a, *args, **kwargs):
-    return np.var._implementation(a.view(np.ndarray), *args, **kwargs) * a.units**2
+    au = a.units
+    ret_units = au if au is NULL_UNIT else _pow_units(au, 2)
+    return np.var._implementation(a.view(np.ndarray), *args, **kwargs) * ret_units
 
 
 @implements(np.trace)
@@ -599,9 +737,11 @@ def nanquantile(a, *args, **kwargs):
 
 @implements(np.linalg.det)
 def linalg_det(a, *args, **kwargs):
-    return np.linalg.det._implementation(
-        a.view(np.ndarray), *args, **kwargs
-    ) * a.units ** (a.shape[0])
+    au = a.units
+    ret_units = au if au is NULL_UNIT else _pow_units(au, a.shape[0])
+    return (
+        np.linalg.det._implementation(a.view(np.ndarray), *args, **kwargs) * ret_units
+    )
 
 
 @implements(np.linalg.lstsq)
@@ -609,34 +749,35 @@ def linalg_lstsq(a, b, *args, **kwargs):
     x, residuals, rank, s = np.linalg.lstsq._implementation(
         a.view(np.ndarray), b.view(np.ndarray), *args, **kwargs
     )
-    au = getattr(a, "units", NULL_UNIT)
-    bu = getattr(b, "units", NULL_UNIT)
-    return (x * bu / au, residuals * bu / au, rank, s * au)
+    au = _units_of(a)
+    bu = _units_of(b)
+    ret_units = _quotient_units(bu, au)
+    return (x * ret_units, residuals * ret_units, rank, s * au)
 
 
 @implements(np.linalg.solve)
 def linalg_solve(a, b, *args, **kwargs):
-    au = getattr(a, "units", NULL_UNIT)
-    bu = getattr(b, "units", NULL_UNIT)
+    au = _units_of(a)
+    bu = _units_of(b)
+    ret_units = _quotient_units(bu, au)
     return (
         np.linalg.solve._implementation(
             a.view(np.ndarray), b.view(np.ndarray), *args, **kwargs
         )
-        * bu
-        / au
+        * ret_units
     )
 
 
 @implements(np.linalg.tensorsolve)
 def linalg_tensorsolve(a, b, *args, **kwargs):
-    au = getattr(a, "units", NULL_UNIT)
-    bu = getattr(b, "units", NULL_UNIT)
+    au = _units_of(a)
+    bu = _units_of(b)
+    ret_units = _quotient_units(bu, au)
     return (
         np.linalg.tensorsolve._implementation(
             a.view(np.ndarray), b.view(np.ndarray), *args, **kwargs
         )
-        * bu
-        / au
+        * ret_units
     )
 
 
@@ -695,7 +836,7 @@ def apply_over_axes(func, a, axes):
 
 
 def diff_helper(func, arr, *args, **kwargs):
-    u = getattr(arr, "units", NULL_UNIT)
+    u = _units_of(arr)
     if u.dimensions is temperature:
         if u.base_offset:
             raise InvalidUnitOperation(
@@ -739,7 +880,7 @@ def pad(array, *args, **kwargs):
 
 @implements(np.choose)
 def choose(a, choices, out=None, *args, **kwargs):
-    if (au := getattr(a, "units", NULL_UNIT)) != NULL_UNIT:
+    if (au := _units_of(a)) != NULL_UNIT:
         raise TypeError(
             f"The first argument to numpy.choose must be dimensionless, got units={au}"
         )
@@ -760,9 +901,8 @@ def choose(a, choices, out=None, *args, **kwargs):
         out=out.view(np.ndarray),
         **kwargs,
     )
-    if getattr(out, "units", None) is not None:
-        out.units = retu
-    return unyt_array(res, retu, bypass_validation=True)
+    _set_units(out, retu)
+    return _fast_wrap(res, retu)
 
 
 @implements(np.fill_diagonal)
@@ -864,29 +1004,26 @@ def sinc(x, *args, **kwargs):
 
 @implements(np.clip)
 def clip(a, a_min, a_max, out=None, *args, **kwargs):
-    _validate_units_consistency_v2(a.units, a_min, a_max)
+    ret_units = a.units
+    _validate_units_consistency_v2(ret_units, a_min, a_max)
     if out is None:
         return (
             np.clip._implementation(
                 np.asarray(a), np.asarray(a_min), np.asarray(a_max), *args, **kwargs
             )
-            * a.units
+            * ret_units
         )
 
-    res = (
-        np.clip._implementation(
-            np.asarray(a),
-            np.asarray(a_min),
-            np.asarray(a_max),
-            *args,
-            out=out.view(np.ndarray),
-            **kwargs,
-        )
-        * a.units
+    res = np.clip._implementation(
+        np.asarray(a),
+        np.asarray(a_min),
+        np.asarray(a_max),
+        *args,
+        out=out.view(np.ndarray),
+        **kwargs,
     )
-    if getattr(out, "units", None) is not None:
-        out.units = a.units
-    return unyt_array(res, a.units, bypass_validation=True)
+    _set_units(out, ret_units)
+    return _fast_wrap(res, ret_units)
 
 
 @implements(np.where)
@@ -930,15 +1067,9 @@ def einsum(subscripts, *operands, out=None, **kwargs):
 
     res = np.einsum._implementation(subscripts, *operands, out=out_view)
 
-    if getattr(out, "units", None) is not None:
-        out.units = ret_units
-
-    if res.ndim == 0:
-        cls = unyt_quantity
-    else:
-        cls = unyt_array
+    _set_units(out, ret_units)
 
-    return cls(res, ret_units, bypass_validation=True)
+    return _fast_wrap(res, ret_units)
 
 
 @implements(np.convolve)
@@ -1006,7 +1137,7 @@ def array_repr(arr, *args, **kwargs):
         return rep[:-1] + ", '" + units_repr + "')"
 
 
-if NUMPY_VERSION < Version("2.0.0dev0"):
+if NUMPY_VERSION < (2, 0):
     # functions that are removed in numpy 2.0.0
     @implements(np.asfarray)
     def asfarray(a, dtype=np.double):
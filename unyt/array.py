@@ -2028,14 +2028,16 @@ class unyt_array(np.ndarray):
             # leaving other arguments a chance to take the lead
             return NotImplemented
 
-        if func not in _HANDLED_FUNCTIONS:
+        # a single lookup serves both as membership test and dispatch
+        impl = _HANDLED_FUNCTIONS.get(func)
+        if impl is None:
             # default to numpy's private implementation
             return func._implementation(*args, **kwargs)
         # Note: this allows subclasses that don't override
         # __array_function__ to handle unyt_array objects
         if not all(issubclass(t, unyt_array) or t is np.ndarray for t in types):
             return NotImplemented
-        return _HANDLED_FUNCTIONS[func](*args, **kwargs)
+        return impl(*args, **kwargs)
 
     def copy(self, order="C"):
         """
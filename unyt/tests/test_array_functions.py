@@ -1,26 +1,42 @@
 # tests for NumPy __array_function__ support
 import re
-from importlib.metadata import version
+import sys
 
 import numpy as np
 import pytest
-from packaging.version import Version
 
-from unyt import A, K, cm, degC, delta_degC, g, km, rad, s
+from unyt import (
+    A,
+    C,
+    K,
+    cm,
+    degC,
+    delta_degC,
+    dimensionless,
+    g,
+    kg,
+    km,
+    m,
+    rad,
+    s,
+    statC,
+)
 from unyt._array_functions import (
     _HANDLED_FUNCTIONS as HANDLED_FUNCTIONS,
     _UNSUPPORTED_FUNCTIONS as UNSUPPORTED_FUNCTIONS,
+    NUMPY_VERSION,
+    get_units,
 )
 from unyt.array import unyt_array, unyt_quantity
 from unyt.exceptions import (
+    InvalidUnitOperation,
+    IterableUnitCoercionError,
     UnitConversionError,
     UnitInconsistencyError,
     UnytError,
 )
 from unyt.testing import assert_array_equal_units
 
-NUMPY_VERSION = Version(version("numpy"))
-
 # this is a subset of NOT_HANDLED_FUNCTIONS for which there's nothing to do
 # because they don't apply to (real) numeric types
 # or they work as expected out of the box
@@ -308,6 +324,40 @@ def test_dot_matrices(out):
         assert out.units == res.units
 
 
+@pytest.mark.parametrize(
+    "func, other",
+    [
+        (np.dot, 2),
+        (np.inner, 2),
+        (np.outer, 2),
+        (np.kron, 2),
+        (np.dot, [2, 2, 2]),
+        (np.vdot, [2, 2, 2]),
+        (np.inner, [2, 2, 2]),
+        (np.outer, [2, 2, 2]),
+        (np.kron, [2, 2, 2]),
+    ],
+)
+def test_product_with_non_array_operand(func, other):
+    a = [1, 2, 3] * cm
+    res = func(a, other)
+    assert res.units == cm
+    np.testing.assert_array_equal(res.d, func(a.d, other))
+
+
+@pytest.mark.parametrize(
+    "func", [np.dot, np.vdot, np.inner, np.outer, np.kron, np.cross]
+)
+def test_product_with_quantity_list_operand(func):
+    a = [1, 2, 3] * cm
+    other = [1 * s, 2 * s, 3 * s]
+    res = func(a, other)
+    assert res.units == cm * s
+    np.testing.assert_array_equal(res.d, func(a.d, [1, 2, 3]))
+    with pytest.raises(IterableUnitCoercionError):
+        func(a, [1 * s, 2 * cm, 3 * s])
+
+
 def test_dot_mixed_ndarray_unyt_array():
     a = np.ones((3, 3))
     b = np.ones((3, 3)) * cm
@@ -447,6 +497,36 @@ def test_histogram():
     assert bins.units == arr.units
 
 
+@pytest.mark.parametrize(
+    "arr, lo, hi",
+    [
+        (np.linspace(0, 1, 100) * cm, 0.2 * cm, 0.8 * cm),
+        (np.linspace(0, 1, 100) * cm, 2e-6 * km, 8e-6 * km),
+        (np.linspace(300, 400, 100) * K, 50 * degC, 100 * degC),
+        (np.linspace(30, 130, 100) * degC, 320 * K, 380 * K),
+        (np.linspace(0, 1, 100) * C, 599584916 * statC, 2398339664 * statC),
+    ],
+)
+def test_histogram_range_conversion(arr, lo, hi):
+    counts, bins = np.histogram(arr, bins=10, range=(lo, hi))
+    ref_range = (lo.to(arr.units).value, hi.to(arr.units).value)
+    ref_counts, ref_bins = np.histogram(arr.d, bins=10, range=ref_range)
+    np.testing.assert_array_equal(counts, ref_counts)
+    np.testing.assert_array_equal(bins.d, ref_bins)
+    assert bins.units == arr.units
+
+
+def test_histogram_range_wrong_length():
+    x = np.arange(10.0) * cm
+    y = np.arange(10.0) * s
+    with pytest.raises(ValueError, match="range bounds"):
+        np.histogram(x, range=(0 * cm,))
+    with pytest.raises(ValueError, match="range bounds"):
+        np.histogram2d(x, y, range=(0 * cm, 9 * cm, 0 * s))
+    with pytest.raises(ValueError, match="range bounds"):
+        np.histogramdd((x, y), range=(0 * cm, 9 * cm, 0 * s, 9 * s, 0 * s))
+
+
 def test_histogram2d():
     x = np.random.normal(size=100) * cm
     y = np.random.normal(loc=10, size=100) * s
@@ -466,6 +546,39 @@ def test_histogramdd():
     assert ybins.units == y.units
     assert zbins.units == z.units
 
+    counts, (xbins, ybins, zbins) = np.histogramdd(
+        (x, y, z), range=(-1 * m, 1 * m, -1 * s, 1 * s, -1 * kg, 1 * kg)
+    )
+    assert counts.ndim == 3
+    np.testing.assert_allclose(xbins.d[[0, -1]], [-100, 100])
+    np.testing.assert_allclose(ybins.d[[0, -1]], [-1, 1])
+    np.testing.assert_allclose(zbins.d[[0, -1]], [-1000, 1000])
+
+
+def test_histogramdd_quantity_list_sample():
+    x = [1, 2, 3] * cm
+    y = [1 * s, 2 * s, 3 * s]
+    counts, (xbins, ybins) = np.histogramdd([x, y], bins=2)
+    ref_counts, (ref_xbins, ref_ybins) = np.histogramdd([x.d, [1, 2, 3]], bins=2)
+    np.testing.assert_array_equal(counts, ref_counts)
+    assert_array_equal_units(xbins, ref_xbins * cm)
+    assert_array_equal_units(ybins, ref_ybins * s)
+
+
+def test_histogramdd_1d_range():
+    x = np.arange(10) * cm
+    counts, (bins,) = np.histogramdd((x,), bins=5, range=(0 * cm, 0.05 * m))
+    ref_counts, (ref_bins,) = np.histogramdd((x.d,), bins=5, range=[(0, 5)])
+    np.testing.assert_array_equal(counts, ref_counts)
+    np.testing.assert_array_equal(bins.d, ref_bins)
+    assert bins.units == cm
+
+
+def test_histogram_unitless_range():
+    arr = np.linspace(0, 1, 100) * cm
+    with pytest.raises(TypeError, match="units"):
+        np.histogram(arr, range=(0.2, 0.8))
+
 
 def test_histogram_bin_edges():
     arr = np.random.normal(size=1000) * cm
@@ -474,6 +587,44 @@ def test_histogram_bin_edges():
     assert bins.units == arr.units
 
 
+def test_histogram_bin_edges_range_conversion():
+    arr = [1.0, 2.0, 3.0] * cm
+    bins = np.histogram_bin_edges(arr, bins=3, range=(0 * m, 0.03 * m))
+    ref = np.histogram_bin_edges(arr.d, bins=3, range=(0, 3))
+    assert bins.units == cm
+    np.testing.assert_allclose(bins.d, ref)
+
+
+@pytest.mark.parametrize(
+    "bins", [np.array([0.0, 5.0, 10.0]) * cm, np.array([0.0, 5.0, 10.0])]
+)
+def test_histogram_array_bins_not_aliased(bins):
+    x = np.arange(10.0) * cm
+    y = np.arange(10.0) * cm
+    _, edges = np.histogram(x, bins=bins)
+    assert not np.shares_memory(edges, bins)
+    assert not np.shares_memory(np.histogram_bin_edges(x, bins=bins), bins)
+    _, xedges, yedges = np.histogram2d(x, y, bins=bins)
+    assert not np.shares_memory(xedges, bins)
+    assert not np.shares_memory(yedges, bins)
+    _, xedges, yedges = np.histogram2d(x, y, bins=[bins, bins])
+    assert not np.shares_memory(xedges, bins)
+    assert not np.shares_memory(yedges, bins)
+    np.testing.assert_array_equal(edges.d, [0, 5, 10])
+
+
+def test_histogramdd_array_bins_not_aliased():
+    x = np.arange(10.0) * cm
+    y = np.arange(10.0) * s
+    ex = np.array([0.0, 5.0, 10.0]) * cm
+    ey = np.array([0.0, 2.0, 10.0]) * s
+    _, (xedges, yedges) = np.histogramdd((x, y), bins=[ex, ey])
+    assert not np.shares_memory(xedges, ex)
+    assert not np.shares_memory(yedges, ey)
+    assert_array_equal_units(xedges, ex)
+    assert_array_equal_units(yedges, ey)
+
+
 def test_concatenate():
     x1 = np.random.normal(size=100) * cm
     x2 = np.random.normal(size=100) * cm
@@ -513,9 +664,15 @@ def test_intersect1d():
 def test_intersect1d_return_indices():
     x1 = [1, 2, 3, 4, 5, 6, 7, 8] * cm
     x2 = [0, 2, 4, 6, 8] * cm
-    ures = np.intersect1d(x1, x2, return_indices=True)
-    rres = np.intersect1d(x1.d, x2.d, return_indices=True)
-    np.testing.assert_array_equal(ures, rres)
+    values, ind1, ind2 = np.intersect1d(x1, x2, return_indices=True)
+    ref_values, ref_ind1, ref_ind2 = np.intersect1d(x1.d, x2.d, return_indices=True)
+    assert type(values) is unyt_array
+    assert values.units == cm
+    np.testing.assert_array_equal(values.d, ref_values)
+    assert type(ind1) is np.ndarray
+    assert type(ind2) is np.ndarray
+    np.testing.assert_array_equal(ind1, ref_ind1)
+    np.testing.assert_array_equal(ind2, ref_ind2)
 
 
 def test_union1d():
@@ -526,6 +683,16 @@ def test_union1d():
     np.testing.assert_array_equal(res, [-3, -2, -1, 0, 1])
 
 
+@pytest.mark.parametrize("func", [np.intersect1d, np.union1d])
+def test_set_ops_with_plain_ndarray(func):
+    x1 = np.array([1.0, 2.0, 3.0])
+    x2 = [2.0, 3.0, 4.0] * dimensionless
+    res = func(x1, x2)
+    assert type(res) is unyt_array
+    assert res.units == dimensionless
+    np.testing.assert_array_equal(res, func(x1, x2.d))
+
+
 def test_linalg_norm():
     x = [1, 1, 1] * s
     res = np.linalg.norm(x)
@@ -540,6 +707,25 @@ def test_xstack(func):
     res = func((x1, x2))
     assert type(res) is unyt_array
     assert res.units == cm
+    np.testing.assert_array_equal(res, func((x1.d, x2.d)))
+
+
+@pytest.mark.parametrize(
+    "func", [np.concatenate, np.vstack, np.hstack, np.dstack, np.column_stack]
+)
+def test_xstack_nested_units_inconsistency(func):
+    with pytest.raises(UnitInconsistencyError):
+        func(([1.0, 2.0] * dimensionless, [3 * cm, 4 * cm]))
+
+
+def test_hstack_scalars():
+    res = np.hstack((0 * cm, [1, 2] * cm, 3 * cm))
+    assert type(res) is unyt_array
+    assert_array_equal_units(res, [0, 1, 2, 3] * cm)
+    res = np.hstack(([1.0, 2.0] * dimensionless, [3.0, 4.0]))
+    assert type(res) is unyt_array
+    assert res.units == dimensionless
+    np.testing.assert_array_equal(res.d, [1, 2, 3, 4])
 
 
 @pytest.mark.parametrize(
@@ -638,7 +824,7 @@ def test_append_inconsistent_units():
 
 
 @pytest.mark.skipif(
-    NUMPY_VERSION >= Version("2.0.0dev0"), reason="np.asfarray is removed in numpy 2.0"
+    NUMPY_VERSION >= (2, 0), reason="np.asfarray is removed in numpy 2.0"
 )
 def test_asfarray():
     x1 = np.eye(3, dtype="int64") * cm
@@ -666,6 +852,14 @@ def test_block_units_inconsistency():
         np.block([[x1, x2]])
 
 
+def test_get_units_deep_nesting():
+    # nesting deeper than the recursion limit must not exhaust the stack
+    nested = [1 * cm, [2 * cm]]
+    for _ in range(sys.getrecursionlimit() + 10):
+        nested = [nested]
+    assert get_units(nested) == [cm, cm]
+
+
 def test_can_cast():
     a = [0, 1, 2] * cm
     assert np.can_cast(a, "float64")
@@ -839,6 +1033,9 @@ def test_allclose():
     [
         ([1, 2, 3] * cm, [1, 2, 3] * km, [False] * 3),
         ([1, 2, 3] * cm, [1, 2, 3], [True] * 3),
+        ([1, 2, 3], [1, 2, 3] * cm, [True] * 3),
+        (2 * cm, [1, 2, 3] * cm, [False, True, False]),
+        ([1, 2, 3] * cm, [0.01, 0.02, 0.03] * m, [True] * 3),
         ([1, 2, 3] * K, [-272.15, -271.15, -270.15] * degC, [True] * 3),
     ],
 )
@@ -1165,6 +1362,45 @@ def test_linalg_solve(func):
     assert x.units == g / cm
 
 
+@pytest.mark.parametrize("func", [np.linalg.solve, np.linalg.tensorsolve])
+def test_linalg_solve_unitless_lhs(func):
+    a = np.eye(3)
+    b = np.ones(3).T * g
+
+    x = func(a, b)
+    assert type(x) is unyt_array
+    assert str(x.units) == "g"
+
+
+@pytest.mark.parametrize("func", [np.linalg.inv, np.fft.fft])
+def test_reciprocal_dimensionless(func):
+    a = np.eye(3) * dimensionless
+    res = func(a)
+    assert type(res) is unyt_array
+    assert res.units == dimensionless
+    np.testing.assert_array_equal(res.d, func(a.d))
+
+
+@pytest.mark.parametrize("func", [np.linalg.solve, np.linalg.tensorsolve])
+@pytest.mark.parametrize(
+    "b, expected", [(np.ones(2), "1/degC"), ([1.0, 2.0] * cm, "cm/degC")]
+)
+def test_linalg_solve_offset_units_lhs(func, b, expected):
+    a = np.eye(2) * degC
+    x = func(a, b)
+    assert type(x) is unyt_array
+    assert str(x.units) == expected
+    np.testing.assert_array_equal(x.d, func(a.d, np.asarray(b)))
+
+
+@pytest.mark.parametrize("func", [np.linalg.solve, np.linalg.tensorsolve])
+def test_linalg_solve_offset_units(func):
+    a = np.eye(2) * degC
+    b = [1.0, 2.0] * degC
+    with pytest.raises(InvalidUnitOperation):
+        func(a, b)
+
+
 def is_any_dimless(x) -> bool:
     return (not hasattr(x, "units")) or x.units.is_dimensionles
 
@@ -1550,6 +1786,15 @@ def test_clip(vmin, vmax):
     assert_array_equal_units(res, [3, 3, 3, 4, 4, 4] * cm)
 
 
+def test_clip_out():
+    a = [1, 2, 3, 4, 5, 6] * cm
+    out = np.zeros(6) * km
+    res = np.clip(a, 3 * cm, 4 * cm, out=out)
+    assert_array_equal_units(res, [3, 3, 3, 4, 4, 4] * cm)
+    assert out.units == cm
+    assert np.shares_memory(res, out)
+
+
 def test_where_mixed_units():
     x = [-1, 2, -3] * cm
     y = [0, 0, 0]